@@ -47,10 +47,10 @@ def example_library_usage():
             print(f"  📝 r/{subreddit}: {len(post_list)} posts")
             # Show first post as example
             first_post = post_list[0]
-            print(f"    🔗 Latest: \"{first_post['title'][:60]}...\"")
-            print(f"    👤 Author: {first_post['author']}")
-            print(f"    ⬆️  Score: {first_post['score']}")
-            print(f"    💬 Comments: {first_post['num_comments']}")
+            print(f"    🔗 Latest: \"{first_post.title[:60]}...\"")
+            print(f"    👤 Author: {first_post.author}")
+            print(f"    ⬆️  Score: {first_post.score}")
+            print(f"    💬 Comments: {first_post.num_comments}")
             print()
         else:
             print(f"  📝 r/{subreddit}: No posts found")
@@ -4,7 +4,8 @@ Reddit Scraper Package
 A Python package for scraping Reddit posts from multiple subreddits.
 """
 
-from .reddit_scraper import (RedditScraper, delete_results_files, main,
+from .reddit_scraper import (Post, RedditScraper, Reply, TokenBucket,
+                             delete_results_files, main, read_json_file,
                              setup_logging)
 
 __version__ = "1.0.0"
@@ -12,7 +13,11 @@ __author__ = "Reddit Scraper Team"
 
 __all__ = [
     "RedditScraper",
+    "TokenBucket",
+    "Post",
+    "Reply",
     "setup_logging", 
     "delete_results_files",
+    "read_json_file",
     "main"
 ]
@@ -3,22 +3,154 @@
 Pytest configuration and fixtures for Reddit Scraper tests
 """
 
+import io
+import itertools
 import json
 import os
+import shutil
+import sys
 import tempfile
-from datetime import datetime
+import uuid
+from http import HTTPStatus
+from datetime import datetime, timedelta
 
 import pytest
+import requests
+import urllib3
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from reddit_scraper import RedditScraper, _load_config_cached
+
+
+SHM_TEMP_DIR = '/dev/shm/reddit_scraper_tests'
+
+
+def pytest_configure(config):
+    """Keep temporary files in RAM-backed /dev/shm on Linux, unless TMPDIR picks a location."""
+    if sys.platform.startswith('linux') and not os.environ.get('TMPDIR') and os.access('/dev/shm', os.W_OK):
+        os.makedirs(SHM_TEMP_DIR, exist_ok=True)
+        tempfile.tempdir = SHM_TEMP_DIR
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    """Drop cached config files so tests that mock open() see their own data."""
+    _load_config_cached.cache_clear()
+    yield
+    _load_config_cached.cache_clear()
+
+
+class FakeHTTP(dict):
+    """
+    Canned responses keyed by full URL, as {url: (status, json_body)}; a bytes body is sent unencoded.
+
+    Bodies are encoded to bytes once when a route is set, so copying a
+    FakeHTTP (FakeHTTP(other)) shares them. URLs that are fetched are
+    appended to calls; a URL without an entry raises ConnectionError,
+    like an unreachable host.
+    """
+
+    def __init__(self, routes=()):
+        super().__init__(routes)
+        self.calls = []
+
+    def __setitem__(self, url, response):
+        status, body = response
+        if body is None:
+            data = b''
+        elif isinstance(body, bytes):
+            data = body  # Served as-is, e.g. a non-JSON error page
+        else:
+            data = json.dumps(body).encode('utf-8')
+        super().__setitem__(url, (status, data))
+
+    def send(self, adapter, request, **kwargs):
+        """Stand-in for HTTPAdapter.send that builds a real response from the table."""
+        try:
+            status, data = self[request.url]
+        except KeyError:
+            raise requests.exceptions.ConnectionError(f"No fake response for {request.url}") from None
+        self.calls.append(request.url)
+        raw = urllib3.HTTPResponse(
+            body=io.BytesIO(data),
+            headers={'Content-Type': 'application/json'},
+            status=status,
+            reason=HTTPStatus(status).phrase,
+            preload_content=False
+        )
+        return adapter.build_response(request, raw)
+
+
+@pytest.fixture(scope='session')
+def reddit_routes(sample_reddit_data, sample_comments_data):
+    """The default Reddit endpoints used by the tests, built and encoded once per session."""
+    routes = FakeHTTP()
+    routes['https://www.reddit.com/r/Python/hot.json?limit=10'] = (200, sample_reddit_data)
+    routes['https://www.reddit.com/r/Python/top.json?limit=10&t=month'] = (200, sample_reddit_data)
+    for post_id, limit in (('test1', 10), ('test2', 10), ('test123', 5), ('test123', 1)):
+        url = f'https://www.reddit.com/r/Python/comments/{post_id}.json?limit={limit}&depth=1&showmore=false&raw_json=1'
+        routes[url] = (200, sample_comments_data)
+    return routes
+
+
+@pytest.fixture
+def fake_http(monkeypatch, reddit_routes):
+    """Serve HTTP requests from a copy of reddit_routes that each test may override."""
+    routes = FakeHTTP(reddit_routes)
+    # Patching the adapter rather than Session.get keeps retries, streaming
+    # and requests-cache's CachedSession on their real code paths
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, 'send',
+                        lambda adapter, request, **kwargs: routes.send(adapter, request, **kwargs))
+    return routes
+
+
+def _load_json(path):
+    """Read and parse a JSON file, using orjson when it is installed."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+@pytest.fixture(scope='session')
+def load_json():
+    """Return a function that parses a saved JSON file."""
+    return _load_json
+
+
+@pytest.fixture(scope='class')
+def class_tmp(tmp_path_factory):
+    """A temporary directory shared by all tests in a class (or module, for test functions)."""
+    return tmp_path_factory.mktemp('class')
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as td:
-        yield td
+def temp_dir(class_tmp, request):
+    """Create a fresh subdirectory of the class temporary directory for a test."""
+    path = class_tmp / request.node.name
+    path.mkdir()
+    return str(path)
+
+
+@pytest.fixture(scope='session')
+def session_tmp(tmp_path_factory):
+    """A temporary directory shared by the whole session."""
+    return tmp_path_factory.mktemp('results')
 
 
 @pytest.fixture
+def results_dir(session_tmp):
+    """A fresh results directory under session_tmp, removed after the test."""
+    path = session_tmp / uuid.uuid4().hex
+    path.mkdir()
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(scope='session')
 def sample_config():
     """Sample configuration for tests."""
     return {
@@ -27,13 +159,25 @@ def sample_config():
         'days_ago': 7,
         'clear_logs': False,
         'sleep_seconds': 0.1,
-        'get_post_replies': True,
+        'get_post_replies': False,
         'delete_results': False
     }
 
 
-@pytest.fixture
-def sample_reddit_data():
+@pytest.fixture(scope='session')
+def now_ts():
+    """Timestamp captured once per session for 'recent' sample data."""
+    return datetime.now().timestamp()
+
+
+@pytest.fixture(scope='session')
+def seven_days_ago(now_ts):
+    """Cutoff timestamp for the default 7-day window, relative to now_ts."""
+    return int(now_ts - timedelta(days=7).total_seconds())
+
+
+@pytest.fixture(scope='session')
+def sample_reddit_data(now_ts):
     """Sample Reddit API response data."""
     return {
         'data': {
@@ -44,10 +188,11 @@ def sample_reddit_data():
                         'author': 'test_user',
                         'score': 100,
                         'num_comments': 5,
-                        'created_utc': datetime.now().timestamp(),
+                        'created_utc': now_ts,
                         'url': 'https://reddit.com/test1',
                         'selftext': 'This is a test post',
                         'permalink': '/r/Python/comments/test1/',
+                        'id': 'test1',
                         'link_flair_text': 'Discussion',
                         'is_video': False
                     }
@@ -58,10 +203,11 @@ def sample_reddit_data():
                         'author': 'another_user',
                         'score': 50,
                         'num_comments': 2,
-                        'created_utc': datetime.now().timestamp() - 3600,
+                        'created_utc': now_ts - 3600,  # 1 hour ago
                         'url': 'https://reddit.com/test2',
                         'selftext': '',
                         'permalink': '/r/Python/comments/test2/',
+                        'id': 'test2',
                         'link_flair_text': 'Help',
                         'is_video': True
                     }
@@ -71,10 +217,123 @@ def sample_reddit_data():
     }
 
 
-@pytest.fixture
-def config_file(temp_dir, sample_config):
-    """Create a temporary config file."""
-    config_path = os.path.join(temp_dir, 'config.json')
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(sample_config, f)
-    return config_path
+def _make_posts(n, base_ts, step=60):
+    """
+    Build a listing response with n posts, newest first, one every step seconds back from base_ts.
+
+    Fields are generated column by column and only zipped into per-post
+    dicts at the end, so large listings stay cheap to build.
+    """
+    ids = [f'p{i}' for i in range(n)]
+    scores = [(i * 37) % 1000 for i in range(n)]
+    timestamps = [base_ts - i * step for i in range(n)]
+    return {
+        'data': {
+            'children': [
+                {
+                    'data': {
+                        'title': f'Post {post_id}',
+                        'author': 'test_user',
+                        'score': score,
+                        'num_comments': 0,
+                        'created_utc': created_utc,
+                        'url': f'https://reddit.com/{post_id}',
+                        'selftext': '',
+                        'permalink': f'/r/Python/comments/{post_id}/',
+                        'id': post_id,
+                        'link_flair_text': None,
+                        'is_video': False
+                    }
+                }
+                for post_id, score, created_utc in zip(ids, scores, timestamps)
+            ]
+        }
+    }
+
+
+@pytest.fixture(scope='session')
+def make_posts():
+    """Return a function that builds a listing response of any size."""
+    return _make_posts
+
+
+@pytest.fixture(scope='session')
+def sample_comments_data(now_ts):
+    """Sample Reddit comments API response data."""
+    return [
+        {},  # First element is post data (not used)
+        {
+            'data': {
+                'children': [
+                    {
+                        'kind': 't1',
+                        'data': {
+                            'author': 'commenter1',
+                            'body': 'Great post!',
+                            'score': 10,
+                            'created_utc': now_ts,
+                            'permalink': '/r/Python/comments/test1/comment1/'
+                        }
+                    },
+                    {
+                        'kind': 't1',
+                        'data': {
+                            'author': 'commenter2',
+                            'body': 'Thanks for sharing',
+                            'score': 5,
+                            'created_utc': now_ts - 1800,
+                            'permalink': '/r/Python/comments/test1/comment2/'
+                        }
+                    }
+                ]
+            }
+        }
+    ]
+
+
+@pytest.fixture(scope='session')
+def write_config(tmp_path_factory):
+    """Return a function that writes a config (dict, or raw text) to a new file and returns its path."""
+    config_dir = tmp_path_factory.mktemp('configs')
+    counter = itertools.count()
+
+    def _write_config(config):
+        config_path = config_dir / f'config_{next(counter)}.json'
+        config_path.write_text(config if isinstance(config, str) else json.dumps(config), encoding='utf-8')
+        return str(config_path)
+
+    return _write_config
+
+
+@pytest.fixture(scope='session')
+def config_file(write_config, sample_config):
+    """Create a config file from sample_config, once per session."""
+    return write_config(sample_config)
+
+
+@pytest.fixture(scope='session')
+def integration_config():
+    """Configuration for the integration tests: one subreddit, no delays."""
+    return {
+        'subreddits': ['Python'],
+        'limit': 5,
+        'days_ago': 7,
+        'clear_logs': False,
+        'sleep_seconds': 0,
+        'get_post_replies': False,
+        'delete_results': False
+    }
+
+
+@pytest.fixture(scope='session')
+def integration_config_file(write_config, integration_config):
+    """Create a config file from integration_config, once per session."""
+    return write_config(integration_config)
+
+
+@pytest.fixture(scope='session')
+def scraper(config_file):
+    """A RedditScraper shared by the whole session; use monkeypatch to change its attributes."""
+    scraper = RedditScraper(config_file=config_file)
+    yield scraper
+    scraper.close()
@@ -3,164 +3,141 @@
 Integration tests for Reddit Scraper - tests basic functionality without mocking
 """
 
-import json
 import os
+import subprocess
 import sys
-import tempfile
-import unittest
-from unittest.mock import mock_open, patch
-
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
-
-from reddit_scraper import RedditScraper
-
-
-class TestRedditScraperIntegration(unittest.TestCase):
-    """Integration tests that don't require external libraries."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_config = {
-            'subreddits': ['Python'],
-            'limit': 5,
-            'days_ago': 7,
-            'clear_logs': False,
-            'sleep_seconds': 0,
-            'get_post_replies': False,
-            'delete_results': False
-        }
-    
-    def test_initialization_defaults(self):
-        """Test scraper initialization with defaults."""
-        with patch('os.path.exists', return_value=False):
-            scraper = RedditScraper()
-            self.assertEqual(scraper.subreddits, ['Python'])
-            self.assertEqual(scraper.default_limit, 25)
-            self.assertEqual(scraper.default_days_ago, 7)
-    
-    def test_initialization_with_config(self):
-        """Test scraper initialization with config."""
-        config_json = json.dumps(self.test_config)
-        with patch('builtins.open', mock_open(read_data=config_json)):
-            with patch('os.path.exists', return_value=True):
-                scraper = RedditScraper()
-                self.assertEqual(scraper.subreddits, ['Python'])
-                self.assertEqual(scraper.default_limit, 5)
-                self.assertEqual(scraper.default_days_ago, 7)
-    
-    def test_initialization_with_subreddits_override(self):
-        """Test scraper initialization with subreddits override."""
-        config_json = json.dumps(self.test_config)
-        custom_subreddits = ['javascript', 'nodejs']
-        
-        with patch('builtins.open', mock_open(read_data=config_json)):
-            with patch('os.path.exists', return_value=True):
-                scraper = RedditScraper(subreddits=custom_subreddits)
-                self.assertEqual(scraper.subreddits, custom_subreddits)
-    
-    def test_config_loading_with_invalid_json(self):
-        """Test config loading with invalid JSON."""
-        with patch('builtins.open', mock_open(read_data='invalid json')):
-            with patch('os.path.exists', return_value=True):
-                with patch('reddit_scraper.logging'):
-                    scraper = RedditScraper()
-                    # Should fall back to defaults
-                    self.assertEqual(scraper.subreddits, ['Python'])
-    
-    def test_save_to_json_functionality(self):
-        """Test JSON saving without external dependencies."""
-        scraper = RedditScraper()
-        test_posts = {
-            'Python': [
-                {
-                    'title': 'Test Post',
-                    'author': 'test_user',
-                    'score': 10,
-                    'num_comments': 5,
-                    'created_utc': 1640995200,
-                    'created_date': '2022-01-01 00:00:00',
-                    'url': 'https://example.com',
-                    'selftext': 'Test content',
-                    'permalink': 'https://reddit.com/test',
-                    'flair': 'Discussion',
-                    'is_video': False,
-                    'replies': []
-                }
-            ]
-        }
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            saved_files = scraper.save_to_json(test_posts, temp_dir)
-            
-            # Verify file was created
-            self.assertIn('Python', saved_files)
-            self.assertTrue(os.path.exists(saved_files['Python']))
-            
-            # Verify content
-            with open(saved_files['Python'], 'r', encoding='utf-8') as f:
-                loaded_data = json.load(f)
-                self.assertEqual(len(loaded_data), 1)
-                self.assertEqual(loaded_data[0]['title'], 'Test Post')
-                self.assertEqual(loaded_data[0]['author'], 'test_user')
-    
-    def test_save_to_json_empty_subreddits(self):
-        """Test saving with empty subreddits."""
-        scraper = RedditScraper()
-        test_posts = {
-            'Python': [],
-            'javascript': [{'title': 'JS Post', 'author': 'js_user'}]
-        }
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            saved_files = scraper.save_to_json(test_posts, temp_dir)
-            
-            # Only non-empty subreddits should be saved
-            self.assertNotIn('Python', saved_files)
-            self.assertIn('javascript', saved_files)
-    
-    def test_save_combined_json(self):
-        """Test combined JSON saving."""
-        scraper = RedditScraper()
-        test_posts = {
-            'Python': [{'title': 'Python Post'}],
-            'javascript': [{'title': 'JS Post'}]
-        }
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            original_cwd = os.getcwd()
-            os.chdir(temp_dir)
-            
-            try:
-                filename = scraper.save_combined_json(test_posts)
-                
-                self.assertTrue(os.path.exists(filename))
-                
-                with open(filename, 'r', encoding='utf-8') as f:
-                    loaded_data = json.load(f)
-                    self.assertIn('Python', loaded_data)
-                    self.assertIn('javascript', loaded_data)
-                    self.assertEqual(len(loaded_data['Python']), 1)
-                    self.assertEqual(len(loaded_data['javascript']), 1)
-            finally:
-                os.chdir(original_cwd)
-    
-    def test_clear_logs_functionality(self):
-        """Test log clearing functionality."""
-        config_with_clear = self.test_config.copy()
-        config_with_clear['clear_logs'] = True
-        
-        config_json = json.dumps(config_with_clear)
-        
-        with patch('builtins.open', mock_open(read_data=config_json)):
-            with patch('os.path.exists', return_value=True):
-                with patch('builtins.open', mock_open()) as mock_file:
-                    scraper = RedditScraper()
-                    scraper.maybe_clear_logs()
-                    
-                    # Verify file operations occurred
-                    mock_file.assert_called()
-
-
-if __name__ == '__main__':
-    unittest.main()
+
+import pytest
+
+from reddit_scraper import FAST_CONFIG, RedditScraper
+
+
+@pytest.mark.parametrize('use_config, subreddits_arg, expected_subs, expected_limit', [
+    (False, None, ['Python'], 25),  # Missing config file: defaults
+    (True, None, ['Python'], 5),
+    (True, ['javascript', 'nodejs'], ['javascript', 'nodejs'], 5),
+])
+def test_initialization(integration_config_file, use_config, subreddits_arg, expected_subs, expected_limit):
+    """Test scraper initialization from defaults, a config file, and a subreddits override."""
+    if use_config:
+        config_file = integration_config_file
+    else:
+        config_file = os.path.join(os.path.dirname(integration_config_file), 'missing.json')
+
+    scraper = RedditScraper(subreddits=subreddits_arg, config_file=config_file)
+
+    assert scraper.subreddits == expected_subs
+    assert scraper.default_limit == expected_limit
+    assert scraper.default_days_ago == 7
+    assert not scraper.get_post_replies
+
+
+def test_initialization_with_config_overrides(integration_config_file, temp_dir, monkeypatch):
+    """Test that config_overrides (as used by --fast) win over the config file."""
+    monkeypatch.setattr('reddit_scraper.CACHE_NAME', os.path.join(temp_dir, 'cache'))
+    scraper = RedditScraper(config_file=integration_config_file, config_overrides=FAST_CONFIG)
+    scraper.close()
+
+    assert scraper.subreddits == ['Python']
+    assert scraper.reply_workers == 8
+    assert scraper.rate_limiter.rate == 0.5
+    assert scraper.cache_ttl == 60
+
+
+def test_config_loading_with_invalid_json(write_config, caplog):
+    """Test config loading with invalid JSON."""
+    scraper = RedditScraper(config_file=write_config('invalid json'))
+    # Should fall back to defaults
+    assert scraper.subreddits == ['Python']
+    assert 'Error loading config' in caplog.text
+
+
+def test_save_to_json_functionality(scraper, temp_dir, load_json):
+    """Test JSON saving without external dependencies."""
+    test_posts = {
+        'Python': [
+            {
+                'title': 'Test Post',
+                'author': 'test_user',
+                'score': 10,
+                'num_comments': 5,
+                'created_utc': 1640995200,
+                'created_date': '2022-01-01 00:00:00',
+                'url': 'https://example.com',
+                'selftext': 'Test content',
+                'permalink': 'https://reddit.com/test',
+                'flair': 'Discussion',
+                'is_video': False,
+                'replies': []
+            }
+        ]
+    }
+
+    saved_files = scraper.save_to_json(test_posts, temp_dir)
+
+    # Verify file was created
+    assert 'Python' in saved_files
+    assert os.path.exists(saved_files['Python'])
+
+    # Verify content
+    loaded_data = load_json(saved_files['Python'])
+    assert len(loaded_data) == 1
+    assert loaded_data[0]['title'] == 'Test Post'
+    assert loaded_data[0]['author'] == 'test_user'
+
+
+def test_save_to_json_empty_subreddits(scraper, temp_dir):
+    """Test saving with empty subreddits."""
+    test_posts = {
+        'Python': [],
+        'javascript': [{'title': 'JS Post', 'author': 'js_user'}]
+    }
+
+    saved_files = scraper.save_to_json(test_posts, temp_dir)
+
+    # Only non-empty subreddits should be saved
+    assert 'Python' not in saved_files
+    assert 'javascript' in saved_files
+
+
+def test_save_combined_json(scraper, temp_dir, load_json):
+    """Test combined JSON saving."""
+    test_posts = {
+        'Python': [{'title': 'Python Post'}],
+        'javascript': [{'title': 'JS Post'}]
+    }
+
+    filename = scraper.save_combined_json(test_posts, output_dir=temp_dir)
+
+    assert os.path.exists(filename)
+
+    loaded_data = load_json(filename)
+    assert 'Python' in loaded_data
+    assert 'javascript' in loaded_data
+    assert len(loaded_data['Python']) == 1
+    assert len(loaded_data['javascript']) == 1
+
+
+def test_module_import_defers_requests():
+    """Test that importing the scraper module does not import requests or argparse."""
+    src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+    code = "import sys, reddit_scraper; print('requests' in sys.modules, 'argparse' in sys.modules)"
+    result = subprocess.run([sys.executable, '-c', code], cwd=src_dir, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False False'
+
+
+def test_clear_logs_functionality(integration_config, write_config, temp_dir, monkeypatch):
+    """Test log clearing functionality."""
+    config_with_clear = integration_config.copy()
+    config_with_clear['clear_logs'] = True
+
+    log_file = os.path.join(temp_dir, 'reddit_scraper.log')
+    with open(log_file, 'wb') as f:
+        f.write(b'old log line\n')
+
+    monkeypatch.setattr('reddit_scraper.LOG_FILE', log_file)
+    scraper = RedditScraper(config_file=write_config(config_with_clear))
+    scraper.maybe_clear_logs()
+
+    # Verify the log file was emptied
+    assert os.path.getsize(log_file) == 0
@@ -4,104 +4,156 @@ Tests for utility functions in Reddit Scraper
 """
 
 import os
-import sys
-import tempfile
-import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+import pytest
 
 from reddit_scraper import delete_results_files, setup_logging
 
 
-class TestUtilityFunctions(unittest.TestCase):
-    """Test cases for utility functions."""
-    
-    def test_delete_results_files_success(self):
-        """Test successful deletion of results files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test files
-            test_files = ['test1.json', 'test2.json', 'readme.txt']
-            for filename in test_files:
-                filepath = os.path.join(temp_dir, filename)
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write('test content')
-            
-            # Verify files exist
-            for filename in test_files:
-                self.assertTrue(os.path.exists(os.path.join(temp_dir, filename)))
-            
-            # Delete files
-            delete_results_files(temp_dir)
-            
-            # Verify files are deleted
-            remaining_files = os.listdir(temp_dir)
-            self.assertEqual(len(remaining_files), 0)
-    
-    def test_delete_results_files_nonexistent_directory(self):
-        """Test deletion when directory doesn't exist."""
-        # Should not raise an exception
-        try:
-            delete_results_files('/nonexistent/directory/path/that/does/not/exist')
-        except (OSError, IOError) as e:
-            self.fail(f"delete_results_files raised an exception: {e}")
-    
-    def test_delete_results_files_with_subdirectories(self):
-        """Test that subdirectories are left alone."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create files and subdirectory
-            test_files = ['test1.json', 'test2.json']
-            subdir = os.path.join(temp_dir, 'subdir')
-            os.makedirs(subdir)
-            
-            for filename in test_files:
-                filepath = os.path.join(temp_dir, filename)
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write('test content')
-            
-            # Create file in subdirectory
-            subfile = os.path.join(subdir, 'subfile.txt')
-            with open(subfile, 'w', encoding='utf-8') as f:
-                f.write('sub content')
-            
-            # Delete files
-            delete_results_files(temp_dir)
-            
-            # Verify only top-level files are deleted
-            remaining_items = os.listdir(temp_dir)
-            self.assertEqual(len(remaining_items), 1)
-            self.assertEqual(remaining_items[0], 'subdir')
-            self.assertTrue(os.path.exists(subfile))
-    
-    def test_delete_results_files_with_permission_error(self):
-        """Test handling of permission errors during deletion."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_file = os.path.join(temp_dir, 'test.json')
-            with open(test_file, 'w', encoding='utf-8') as f:
-                f.write('test content')
-            
-            # Mock os.remove to raise an exception
-            with patch('os.remove', side_effect=PermissionError("Permission denied")):
-                with patch('builtins.print') as mock_print:
-                    delete_results_files(temp_dir)
-                    # Should print error message but not crash
-                    mock_print.assert_called()
-    
-    @patch('reddit_scraper.logging.basicConfig')
-    def test_setup_logging(self, mock_basic_config):
-        """Test logging setup configuration."""
-        setup_logging()
-        
-        # Verify basicConfig was called with expected parameters
-        mock_basic_config.assert_called_once()
-        call_args = mock_basic_config.call_args
-        
-        # Check that handlers were included in the call
-        self.assertIn('handlers', call_args.kwargs)
-        self.assertIn('level', call_args.kwargs)
-        self.assertIn('format', call_args.kwargs)
-
-
-if __name__ == '__main__':
-    unittest.main()
+@pytest.fixture(scope='module')
+def print_mock():
+    """A print replacement shared by the module; tests reset it before use."""
+    return MagicMock()
+
+
+CONTENT = b'test content'
+
+
+def _touch(path, content=CONTENT):
+    """Create a file holding content with raw os calls, skipping Python's buffered IO layers."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, content)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope='module')
+def link_file(session_tmp):
+    """
+    Return a function that creates a file holding CONTENT as a hardlink to one shared payload.
+
+    The payload lives in session_tmp, on the same filesystem as results_dir,
+    so each new file is a single link() call with no data written.
+    """
+    payload = f'{session_tmp}{os.sep}payload'
+    _touch(payload)
+    yield lambda path: os.link(payload, path)
+    os.unlink(payload)
+
+
+def _raise_permission_error(*args, **kwargs):
+    raise PermissionError("Permission denied")
+
+
+@pytest.mark.parametrize('files, subdirs, fail_unlink, expected', [
+    pytest.param([f'test{i}.json' for i in range(1000)] + ['readme.txt'], [], False, [], id='only-files'),
+    pytest.param(['test1.json', 'test2.json'], ['subdir'], False, ['subdir'], id='keeps-subdirectories'),
+    pytest.param([], [], False, [], id='empty'),
+    pytest.param(['test.json'], [], True, ['test.json'], id='permission-error'),
+])
+def test_delete_results_files(results_dir, monkeypatch, print_mock, link_file, files, subdirs, fail_unlink, expected):
+    """Test that top-level files are deleted, subdirectories kept, and unlink errors printed."""
+    for name in subdirs:
+        subdir = f'{results_dir}{os.sep}{name}'
+        os.mkdir(subdir)
+        _touch(f'{subdir}{os.sep}subfile.txt', b'sub content')
+    for path in [f'{results_dir}{os.sep}{filename}' for filename in files]:
+        link_file(path)
+    assert sorted(os.listdir(results_dir)) == sorted(files + subdirs)
+
+    # Entries are classified from scandir, without a stat per entry
+    stat_calls = []
+    real_stat = os.stat
+    monkeypatch.setattr('os.stat', lambda path, *args, **kwargs: stat_calls.append(path) or real_stat(path, *args, **kwargs))
+    if fail_unlink:
+        monkeypatch.setattr('os.unlink', _raise_permission_error)
+    monkeypatch.setattr('builtins.print', print_mock)
+    print_mock.reset_mock()
+    delete_results_files(results_dir)
+    monkeypatch.undo()
+
+    assert not [path for path in stat_calls if os.path.dirname(path) == str(results_dir)]
+    assert sorted(os.listdir(results_dir)) == expected
+    assert print_mock.called == fail_unlink  # Errors are printed, not raised
+    for name in subdirs:
+        assert os.listdir(f'{results_dir}{os.sep}{name}') == ['subfile.txt']
+
+
+def test_delete_results_files_through_symlinked_directory(results_dir, link_file):
+    """Test that a results directory reached through a symlink is cleared, leaving the link in place."""
+    target = f'{results_dir}{os.sep}target'
+    os.mkdir(target)
+    for filename in ('test1.json', 'test2.json'):
+        link_file(f'{target}{os.sep}{filename}')
+    link = f'{results_dir}{os.sep}results'
+    os.symlink(target, link, target_is_directory=True)
+
+    delete_results_files(link)
+
+    assert os.listdir(target) == []
+    assert os.path.islink(link)
+
+
+def test_delete_results_files_keeps_directory_mode(results_dir, link_file):
+    """Test that the results directory itself is kept, with its permissions."""
+    link_file(f'{results_dir}{os.sep}test.json')
+    os.chmod(results_dir, 0o700)
+    inode = os.stat(results_dir).st_ino
+
+    delete_results_files(results_dir)
+
+    assert os.listdir(results_dir) == []
+    assert os.stat(results_dir).st_mode & 0o777 == 0o700
+    assert os.stat(results_dir).st_ino == inode
+
+
+def test_delete_results_files_with_names(results_dir, link_file):
+    """Test that given names are deleted without a scan, skipping ones already gone."""
+    for filename in ('test1.json', 'test2.json', 'keep.json'):
+        link_file(f'{results_dir}{os.sep}{filename}')
+
+    delete_results_files(results_dir, names=['test1.json', 'test2.json', 'missing.json'])
+
+    assert os.listdir(results_dir) == ['keep.json']
+    delete_results_files(f'{results_dir}{os.sep}missing', names=['test1.json'])
+
+
+def test_delete_results_files_ignores_files_removed_concurrently(results_dir, monkeypatch, print_mock, link_file):
+    """Test that a file deleted between the scan and its unlink is not reported as an error."""
+    os.mkdir(f'{results_dir}{os.sep}subdir')
+    for filename in ('test1.json', 'test2.json'):
+        link_file(f'{results_dir}{os.sep}{filename}')
+
+    real_unlink = os.unlink
+
+    def unlink_twice(path, *args, **kwargs):
+        real_unlink(path, *args, **kwargs)
+        real_unlink(path, *args, **kwargs)
+
+    monkeypatch.setattr('os.unlink', unlink_twice)
+    monkeypatch.setattr('builtins.print', print_mock)
+    print_mock.reset_mock()
+    delete_results_files(results_dir)
+    monkeypatch.undo()
+
+    assert os.listdir(results_dir) == ['subdir']
+    assert not print_mock.called
+
+
+def test_delete_results_files_nonexistent_directory():
+    """Test deletion when directory doesn't exist."""
+    # Should not raise an exception
+    delete_results_files('/nonexistent/directory/path/that/does/not/exist')
+
+
+def test_setup_logging(monkeypatch):
+    """Test logging setup configuration."""
+    calls = []
+    monkeypatch.setattr('reddit_scraper.logging.basicConfig', lambda **kwargs: calls.append(kwargs))
+    setup_logging()
+
+    # Verify basicConfig was called once, with handlers, level and format
+    [kwargs] = calls
+    assert {'handlers', 'level', 'format'} <= kwargs.keys()